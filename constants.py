@@ -1,7 +1,12 @@
 API_REQUEST_FAILURE = 'Сбой при запросе к эндпоинту'
+INVALID_JSON = 'Ответ API не является корректным JSON'
 INVALID_RESPONSE_TYPE = 'Неверный тип данных'
+INVALID_TELEGRAM_TOKEN = 'Telegram отклонил токен бота'
 MISSING_CURRENT_DATE_KEY = 'Отсутствует ключ "current_date"'
 MISSING_HOMEWORK_NAME = 'Отсутствует переменная "homework_name"'
 MISSING_HOMEWORKS_KEY = 'Отсутствует ключ "homeworks"'
 MISSING_TOKENS = 'Отсутствуют обязательные переменные'
+STATE_SAVE_FAILURE = 'Не удалось сохранить метку времени'
+TELEGRAM_CHECK_FAILURE = 'Не удалось проверить токен Telegram-бота'
+UNEXPECTED_ERROR = 'Непредвиденная ошибка, бот остановлен'
 UNEXPECTED_STATUS = 'Неожиданный статус домашней работы'
@@ -1,13 +1,25 @@
+from typing import Optional
+
+
 class TokenNotFoundError(Exception):
     """Исключение, возникающее в случае отсутствия токенов."""
 
     pass
 
 
+class InvalidTokenError(Exception):
+    """Исключение, возникающее при недействительном токене."""
+
+    pass
+
+
 class APINotFoundError(Exception):
     """Исключение, возникающее при сбое в API-запросе."""
 
-    pass
+    def __init__(self, message: str, retry_after: Optional[int] = None):
+        """Сохраняет рекомендуемую сервером паузу перед повтором."""
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class HomeworksNotFoundError(Exception):
@@ -22,6 +34,12 @@ class CurrentDateNotFoundError(Exception):
     pass
 
 
+class InvalidResponseTypeError(TypeError):
+    """Исключение, возникающее при неверном типе данных в ответе API."""
+
+    pass
+
+
 class StatusNotFoundError(Exception):
     """Исключение, возникающее в случае отсутствия статуса задания."""
 
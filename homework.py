@@ -1,20 +1,27 @@
+import atexit
 import logging
 import os
+import queue
+import random
 import sys
 import time
 from http import HTTPStatus
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 
 import requests
 import telegram
 from dotenv import load_dotenv
 
-from constants import (API_REQUEST_FAILURE, INVALID_RESPONSE_TYPE,
+from constants import (API_REQUEST_FAILURE, INVALID_JSON,
+                       INVALID_RESPONSE_TYPE, INVALID_TELEGRAM_TOKEN,
                        MISSING_CURRENT_DATE_KEY, MISSING_HOMEWORK_NAME,
                        MISSING_HOMEWORKS_KEY, MISSING_TOKENS,
-                       UNEXPECTED_STATUS)
+                       STATE_SAVE_FAILURE, TELEGRAM_CHECK_FAILURE,
+                       UNEXPECTED_ERROR, UNEXPECTED_STATUS)
 from exceptions import (APINotFoundError, CurrentDateNotFoundError,
                         EmptyHomeworksError, HomeworksNotFoundError,
+                        InvalidResponseTypeError, InvalidTokenError,
                         NotForSend, StatusNotFoundError, TelegramError,
                         TokenNotFoundError)
 
@@ -27,9 +34,26 @@ TELEGRAM_TOKEN: Optional[str] = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID: Optional[str] = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD: int = 600
+BACKOFF_BASE: int = 2
+BACKOFF_CAP: int = RETRY_PERIOD
+ERROR_REPEAT_PERIOD: int = 3600
+TELEGRAM_MESSAGE_LIMIT: int = 4096
 ENDPOINT: str = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
-HEADERS: dict[str, str] = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+HEADERS: dict[str, str] = {
+    'Authorization': f'OAuth {PRACTICUM_TOKEN}',
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate'
+}
+REQUEST_TIMEOUT: tuple[float, float] = (3.05, 27)
+
 
+RETRIABLE_ERRORS: tuple[type[Exception], ...] = (APINotFoundError,)
+USER_VISIBLE_ERRORS: tuple[type[Exception], ...] = (
+    CurrentDateNotFoundError,
+    HomeworksNotFoundError,
+    InvalidResponseTypeError,
+    StatusNotFoundError
+)
 
 HOMEWORK_VERDICTS: dict[str, str] = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
@@ -39,36 +63,64 @@ HOMEWORK_VERDICTS: dict[str, str] = {
 
 BASE_DIR: str = os.path.dirname(os.path.abspath(__file__))
 LOG_DIR: str = os.path.join(BASE_DIR, 'logs')
-os.makedirs(LOG_DIR, exist_ok=True)
 log_file: str = os.path.join(LOG_DIR, 'telegram_bot.log')
+STATE_FILE: str = os.getenv(
+    'STATE_FILE',
+    os.path.join(BASE_DIR, 'last_timestamp')
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
-handler_stream: logging.StreamHandler = logging.StreamHandler(sys.stdout)
-handler_file: logging.FileHandler = logging.FileHandler(
-    log_file,
-    encoding='utf-8'
-)
-formatter: logging.Formatter = logging.Formatter(
-    '%(asctime)s [%(levelname)s] %(funcName)s:%(lineno)d - %(message)s'
-)
-handler_stream.setFormatter(formatter)
-handler_file.setFormatter(formatter)
-logger.addHandler(handler_stream)
-logger.addHandler(handler_file)
+
+if not logger.handlers:
+    os.makedirs(LOG_DIR, exist_ok=True)
+    handler_stream: logging.StreamHandler = logging.StreamHandler(sys.stdout)
+    handler_file: logging.FileHandler = logging.FileHandler(
+        log_file,
+        encoding='utf-8'
+    )
+    formatter: logging.Formatter = logging.Formatter(
+        '%(asctime)s [%(levelname)s] %(funcName)s:%(lineno)d - %(message)s'
+    )
+    handler_stream.setFormatter(formatter)
+    handler_file.setFormatter(formatter)
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_listener: QueueListener = QueueListener(
+        log_queue,
+        handler_stream,
+        handler_file,
+        respect_handler_level=True
+    )
+    logger.addHandler(QueueHandler(log_queue))
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
 
 
 def check_tokens() -> bool:
     """Проверка доступности переменных окружения."""
-    return all([TELEGRAM_TOKEN, TELEGRAM_CHAT_ID, PRACTICUM_TOKEN])
+    return bool(PRACTICUM_TOKEN and TELEGRAM_TOKEN and TELEGRAM_CHAT_ID)
+
+
+def check_bot(bot: telegram.Bot) -> None:
+    """Проверка действительности токена Telegram-бота."""
+    try:
+        bot.get_me()
+
+    except telegram.error.Unauthorized as error:
+        logger.critical('%s: %s', INVALID_TELEGRAM_TOKEN, error)
+        raise InvalidTokenError(INVALID_TELEGRAM_TOKEN) from error
+
+    except telegram.error.TelegramError as error:
+        logger.critical('%s: %s', TELEGRAM_CHECK_FAILURE, error)
+        raise
 
 
 def send_message(bot: telegram.Bot, message: str) -> None:
     """Отправка сообщения в Telegram чат."""
-    logger.debug(f'Начата отправка сообщения: {message}')
+    logger.debug('Начата отправка сообщения: %s', message)
 
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
-        logger.debug(f'Отправлено сообщение: {message}')
+        logger.debug('Отправлено сообщение: %s', message)
 
     except telegram.error.TelegramError as error:
         raise TelegramError(f'Ошибка при отправке сообщения: {error}')
@@ -82,63 +134,219 @@ def get_api_answer(timestamp: int) -> dict[str, Any]:
         response: requests.Response = requests.get(
             ENDPOINT,
             headers=HEADERS,
-            params=payload
+            params=payload,
+            timeout=REQUEST_TIMEOUT
         )
 
-    except requests.RequestException:
-        logger.error(API_REQUEST_FAILURE)
+    except requests.RequestException as error:
+        logger.debug('%s: %s', API_REQUEST_FAILURE, error)
         raise APINotFoundError(API_REQUEST_FAILURE)
 
     if response.status_code != HTTPStatus.OK:
-        logger.error(API_REQUEST_FAILURE)
-        raise APINotFoundError(API_REQUEST_FAILURE)
+        logger.debug('%s: %s', API_REQUEST_FAILURE, response.status_code)
+        retry_after: Optional[int] = None
 
-    return response.json()
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            header: str = response.headers.get('Retry-After', '')
+            retry_after = int(header) if header.isdigit() else None
+
+        raise APINotFoundError(API_REQUEST_FAILURE, retry_after)
+
+    try:
+        return response.json()
+
+    except ValueError as error:
+        logger.debug('%s: %s', INVALID_JSON, error)
+        raise APINotFoundError(INVALID_JSON)
 
 
 def check_response(response: dict[str, Any]) -> dict[str, Any]:
     """Проверка ответа API на соответствие документации."""
     if not isinstance(response, dict):
-        logger.error(f'{INVALID_RESPONSE_TYPE} ({type(response).__name__})')
-        raise TypeError(f'{INVALID_RESPONSE_TYPE} ({type(response).__name__})')
+        raise InvalidResponseTypeError(
+            f'{INVALID_RESPONSE_TYPE} ({type(response).__name__})'
+        )
 
-    if 'homeworks' not in response:
-        logger.error(MISSING_HOMEWORKS_KEY)
-        raise HomeworksNotFoundError(MISSING_HOMEWORKS_KEY)
+    try:
+        homeworks: list[dict] = response['homeworks']
 
-    homeworks: list[dict] = response.get('homeworks')
+    except KeyError:
+        raise HomeworksNotFoundError(MISSING_HOMEWORKS_KEY)
 
     if not isinstance(homeworks, list):
-        logger.error(f'{INVALID_RESPONSE_TYPE} ({type(homeworks).__name__})')
-        raise TypeError(
+        raise InvalidResponseTypeError(
             f'{INVALID_RESPONSE_TYPE} ({type(homeworks).__name__})'
         )
 
-    if 'current_date' not in response:
-        logger.error(MISSING_CURRENT_DATE_KEY)
+    try:
+        current_date: int = response['current_date']
+
+    except KeyError:
         raise CurrentDateNotFoundError(MISSING_CURRENT_DATE_KEY)
 
+    if not isinstance(current_date, int):
+        raise InvalidResponseTypeError(
+            f'{INVALID_RESPONSE_TYPE} ({type(current_date).__name__})'
+        )
+
     return response
 
 
 def parse_status(homework: dict[str, Any]) -> str:
     """Извлечение из информации статуса домашней работы."""
-    if 'homework_name' not in homework:
-        logger.error(MISSING_HOMEWORK_NAME)
+    if not isinstance(homework, dict):
+        raise InvalidResponseTypeError(
+            f'{INVALID_RESPONSE_TYPE} ({type(homework).__name__})'
+        )
+
+    homework_name: Optional[str] = homework.get('homework_name')
+
+    if homework_name is None:
         raise HomeworksNotFoundError(MISSING_HOMEWORK_NAME)
 
-    homework_name: str = homework.get('homework_name')
-    status: str = homework.get('status')
+    status: Any = homework.get('status')
+    verdict: Optional[str] = (
+        HOMEWORK_VERDICTS.get(status) if isinstance(status, str) else None
+    )
 
-    if status not in HOMEWORK_VERDICTS:
-        logger.error(UNEXPECTED_STATUS)
+    if verdict is None:
         raise StatusNotFoundError(UNEXPECTED_STATUS)
 
-    verdict: str = HOMEWORK_VERDICTS[status]
-
     return f'Изменился статус проверки работы "{homework_name}". {verdict}'
 
 
+def build_report(
+    homeworks: list[dict[str, Any]]
+) -> tuple[str, list[Exception]]:
+    """Сборка статусов корректных домашних работ в одно сообщение."""
+    messages: list[str] = []
+    errors: list[Exception] = []
+
+    for homework in homeworks:
+        try:
+            messages.append(parse_status(homework))
+
+        except USER_VISIBLE_ERRORS as error:
+            errors.append(error)
+
+    return '\n'.join(messages), errors
+
+
+def split_message(message: str) -> list[str]:
+    """Разбиение сообщения на части не длиннее TELEGRAM_MESSAGE_LIMIT."""
+    chunks: list[str] = []
+    chunk: str = ''
+
+    for line in message.split('\n'):
+        while len(line) > TELEGRAM_MESSAGE_LIMIT:
+            if chunk:
+                chunks.append(chunk)
+                chunk = ''
+
+            chunks.append(line[:TELEGRAM_MESSAGE_LIMIT])
+            line = line[TELEGRAM_MESSAGE_LIMIT:]
+
+        if chunk and len(chunk) + len(line) + 1 > TELEGRAM_MESSAGE_LIMIT:
+            chunks.append(chunk)
+            chunk = line
+
+        else:
+            chunk = f'{chunk}\n{line}' if chunk else line
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def send_report(
+    bot: telegram.Bot,
+    homeworks: list[dict[str, Any]],
+    last_message: str,
+    sent_errors: dict[str, float]
+) -> str:
+    """Отправка изменившихся статусов и ошибок в отдельных работах."""
+    message, errors = build_report(homeworks)
+
+    for error in errors:
+        send_error(bot, error, sent_errors)
+
+    if not message or message == last_message:
+        return last_message
+
+    for chunk in split_message(message):
+        send_message(bot, chunk)
+
+    return message
+
+
+def send_error(
+    bot: telegram.Bot,
+    error: Exception,
+    sent_errors: dict[str, float]
+) -> None:
+    """Отправка сообщения об ошибке не чаще раза в ERROR_REPEAT_PERIOD."""
+    message: str = f'Сбой в работе программы: {error}'
+    logger.error(message)
+    now: float = time.monotonic()
+
+    for sent_message, sent_at in list(sent_errors.items()):
+        if now - sent_at >= ERROR_REPEAT_PERIOD:
+            del sent_errors[sent_message]
+
+    if message in sent_errors:
+        logger.debug('Повторная ошибка не отправлена: %s', message)
+        return
+
+    try:
+        send_message(bot, message)
+
+    except TelegramError as telegram_error:
+        logger.error(telegram_error)
+        return
+
+    sent_errors[message] = now
+
+
+def load_timestamp() -> int:
+    """Загрузка метки времени последнего успешного запроса."""
+    try:
+        with open(STATE_FILE, encoding='utf-8') as file:
+            return int(file.read())
+
+    except (OSError, ValueError):
+        timestamp: int = int(time.time())
+        save_timestamp(timestamp)
+        return timestamp
+
+
+def save_timestamp(timestamp: int) -> None:
+    """Атомарное сохранение метки времени последнего успешного запроса."""
+    tmp_file: str = f'{STATE_FILE}.tmp'
+
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            file.write(str(timestamp))
+
+        os.replace(tmp_file, STATE_FILE)
+
+    except OSError as error:
+        logger.error('%s: %s', STATE_SAVE_FAILURE, error)
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[int] = None) -> float:
+    """Расчет паузы перед повторным запросом после сбоя API."""
+    delay: float = random.uniform(
+        0,
+        min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)
+    )
+
+    if retry_after:
+        delay = max(delay, retry_after)
+
+    return delay
+
+
 def main() -> None:
     """Основная логика работы бота."""
     if not check_tokens():
@@ -146,37 +354,54 @@ def main() -> None:
         raise TokenNotFoundError(MISSING_TOKENS)
 
     bot: telegram.Bot = telegram.Bot(token=TELEGRAM_TOKEN)
-    timestamp: int = int(time.time())
-    last_status_message: str = ''
+    check_bot(bot)
+    timestamp: int = load_timestamp()
+    sent_errors: dict[str, float] = {}
+    last_homework_message: str = ''
+    attempt: int = 0
 
     while True:
+        sleep_time: float = RETRY_PERIOD
+
         try:
             response: dict[str, Any] = get_api_answer(timestamp)
-            homeworks: list[dict[str, Any]] = check_response(response).get(
-                'homeworks'
-            )
+            attempt = 0
+            check_response(response)
+            homeworks: list[dict[str, Any]] = response['homeworks']
 
-            if not homeworks:
-                raise EmptyHomeworksError('Отсутствуют новые статусы')
+            if homeworks:
+                last_homework_message = send_report(
+                    bot,
+                    homeworks,
+                    last_homework_message,
+                    sent_errors
+                )
 
-            else:
-                send_message(bot, parse_status(homeworks[0]))
+            timestamp: int = response['current_date']
+            save_timestamp(timestamp)
 
-            timestamp: int = response.get('current_date')
+            if not homeworks:
+                raise EmptyHomeworksError('Отсутствуют новые статусы')
 
         except NotForSend as error:
             logger.error(error)
 
-        except Exception as error:
-            message: str = f'Сбой в работе программы: {error}'
+        except RETRIABLE_ERRORS as error:
+            attempt += 1
+            sleep_time = get_retry_delay(
+                attempt,
+                getattr(error, 'retry_after', None)
+            )
+            send_error(bot, error, sent_errors)
+
+        except USER_VISIBLE_ERRORS as error:
+            send_error(bot, error, sent_errors)
 
-            if message != last_status_message:
-                logger.error(message)
-                send_message(bot, message)
-                last_status_message = message
+        except Exception:
+            logger.exception(UNEXPECTED_ERROR)
+            raise
 
-        finally:
-            time.sleep(RETRY_PERIOD)
+        time.sleep(sleep_time)
 
 
 if __name__ == '__main__':
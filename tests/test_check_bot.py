@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+import telegram
+
+import utils
+
+
+def get_mock_bot_with_error(error):
+    class MockedBotWithError(utils.MockTelegramBot):
+        def get_me(self, **kwargs):
+            raise error
+
+    return MockedBotWithError()
+
+
+class TestCheckBot:
+
+    def test_unauthorized_raises_invalid_token(self, caplog,
+                                               homework_module):
+        bot = get_mock_bot_with_error(telegram.error.Unauthorized('bad'))
+        with utils.check_logging(caplog, level=logging.CRITICAL, message=(
+                'Убедитесь, что недействительный токен Telegram '
+                'логируется с уровнем `CRITICAL`.'
+        )):
+            with pytest.raises(homework_module.InvalidTokenError):
+                homework_module.check_bot(bot)
+
+    @pytest.mark.parametrize('error', [
+        telegram.error.NetworkError('no network'),
+        telegram.error.TimedOut(),
+    ])
+    def test_other_telegram_error_is_reraised(self, caplog, homework_module,
+                                              error):
+        bot = get_mock_bot_with_error(error)
+        with utils.check_logging(caplog, level=logging.CRITICAL, message=(
+                'Убедитесь, что ошибка проверки бота при запуске '
+                'логируется с уровнем `CRITICAL`.'
+        )):
+            with pytest.raises(type(error)) as raised:
+                homework_module.check_bot(bot)
+        assert raised.value is error, (
+            'Ошибка Telegram должна пробрасываться без изменений.'
+        )
+
+    def test_valid_token_passes(self, homework_module):
+        homework_module.check_bot(utils.MockTelegramBot())
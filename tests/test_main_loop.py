@@ -0,0 +1,124 @@
+import pytest
+import requests
+
+import utils
+
+
+class MockResponseNotJSON(utils.MockResponseGET):
+    def json(self):
+        raise requests.exceptions.JSONDecodeError(
+            'Expecting value', '<html></html>', 0
+        )
+
+
+class TestMainLoop:
+
+    @pytest.fixture
+    def sent_messages(self):
+        return []
+
+    @pytest.fixture
+    def bot_class(self, sent_messages):
+        class RecordingTelegramBot(utils.MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                sent_messages.append(text)
+
+        return RecordingTelegramBot
+
+    @pytest.mark.parametrize('status', [{}, [], None, 1])
+    def test_unhashable_status_does_not_stop_bot(self, monkeypatch,
+                                                 homework_module, bot_class,
+                                                 sent_messages, status):
+        data = {
+            'homeworks': [{'homework_name': 'a', 'status': status}],
+            'current_date': 1
+        }
+        sleeps = utils.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [utils.MockResponseGET(data=data)] * 2,
+            bot_class
+        )
+        assert len(sleeps) == 2, (
+            'Неожиданный статус домашней работы не должен '
+            'останавливать бота.'
+        )
+        assert any(
+            homework_module.UNEXPECTED_STATUS in message
+            for message in sent_messages
+        )
+
+    def test_unexpected_error_is_logged_and_raised(self, monkeypatch, caplog,
+                                                   homework_module,
+                                                   bot_class):
+        def broken_check_response(response):
+            raise RuntimeError('bug')
+
+        monkeypatch.setattr(
+            homework_module, 'check_response', broken_check_response
+        )
+        with pytest.raises(RuntimeError):
+            utils.run_main_cycles(
+                monkeypatch,
+                homework_module,
+                [utils.MockResponseGET()],
+                bot_class
+            )
+        records = [
+            record for record in caplog.records
+            if record.getMessage() == homework_module.UNEXPECTED_ERROR
+        ]
+        assert records and records[0].exc_info, (
+            'Непредвиденная ошибка должна логироваться через '
+            '`logger.exception`.'
+        )
+
+    def test_user_visible_error_is_reported(self, monkeypatch,
+                                            homework_module, bot_class,
+                                            sent_messages):
+        data = {'current_date': 1}
+        sleeps = utils.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [utils.MockResponseGET(data=data)] * 2,
+            bot_class
+        )
+        assert sleeps == [homework_module.RETRY_PERIOD] * 2
+        assert sent_messages == [
+            f'Сбой в работе программы: {homework_module.MISSING_HOMEWORKS_KEY}'
+        ]
+
+    def test_not_json_response_is_api_error(self, monkeypatch,
+                                            current_timestamp,
+                                            homework_module):
+        monkeypatch.setattr(
+            requests, 'get', lambda *args, **kwargs: MockResponseNotJSON()
+        )
+        with pytest.raises(homework_module.APINotFoundError) as error:
+            homework_module.get_api_answer(current_timestamp)
+        assert str(error.value) == homework_module.INVALID_JSON
+        assert isinstance(error.value, homework_module.RETRIABLE_ERRORS)
+
+    @pytest.mark.parametrize('current_date', [None, '123', 1.5])
+    def test_invalid_current_date_is_rejected(self, homework_module,
+                                              current_date):
+        with pytest.raises(homework_module.InvalidResponseTypeError):
+            homework_module.check_response(
+                {'homeworks': [], 'current_date': current_date}
+            )
+
+    def test_invalid_current_date_is_not_saved(self, monkeypatch, tmp_path,
+                                               homework_module, bot_class):
+        state_file = tmp_path / 'last_timestamp'
+        state_file.write_text('100')
+        monkeypatch.setattr(homework_module, 'STATE_FILE', str(state_file))
+        data = {'homeworks': [], 'current_date': None}
+        utils.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [utils.MockResponseGET(data=data)],
+            bot_class
+        )
+        assert state_file.read_text() == '100', (
+            'Некорректное значение `current_date` не должно сохраняться.'
+        )
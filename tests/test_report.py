@@ -0,0 +1,97 @@
+import pytest
+
+import utils
+
+
+class TestReport:
+
+    @pytest.fixture
+    def sent_messages(self, monkeypatch, homework_module):
+        sent = []
+        monkeypatch.setattr(
+            homework_module,
+            'send_message',
+            lambda bot, message: sent.append(message)
+        )
+        return sent
+
+    @staticmethod
+    def make_homeworks(qty):
+        return [
+            {'homework_name': f'homework_{index}', 'status': 'approved'}
+            for index in range(qty)
+        ]
+
+    def test_long_report_is_split(self, homework_module, sent_messages):
+        homeworks = self.make_homeworks(60)
+        report, _ = homework_module.build_report(homeworks)
+        assert len(report) > homework_module.TELEGRAM_MESSAGE_LIMIT
+
+        homework_module.send_report(
+            utils.MockTelegramBot(), homeworks, '', {}
+        )
+        assert len(sent_messages) > 1
+        assert all(
+            len(message) <= homework_module.TELEGRAM_MESSAGE_LIMIT
+            for message in sent_messages
+        ), (
+            'Сообщение в Telegram не должно превышать '
+            '`TELEGRAM_MESSAGE_LIMIT` символов.'
+        )
+        assert '\n'.join(sent_messages) == report
+
+    def test_split_message_cuts_long_line(self, homework_module):
+        limit = homework_module.TELEGRAM_MESSAGE_LIMIT
+        message = 'a' * (limit * 2 + 10)
+        chunks = homework_module.split_message(f'b\n{message}\nc')
+        assert chunks == [
+            'b', 'a' * limit, 'a' * limit, 'a' * 10 + '\nc'
+        ]
+
+    def test_homeworks_are_sent_in_one_message(self, homework_module,
+                                               sent_messages):
+        homeworks = self.make_homeworks(3)
+        homework_module.send_report(
+            utils.MockTelegramBot(), homeworks, '', {}
+        )
+        assert len(sent_messages) == 1, (
+            'Статусы всех домашних работ должны отправляться '
+            'одним сообщением.'
+        )
+        assert sent_messages[0] == '\n'.join(
+            homework_module.parse_status(homework) for homework in homeworks
+        )
+
+    def test_malformed_homework_does_not_block_report(self, monkeypatch,
+                                                      homework_module,
+                                                      sent_messages):
+        errors = []
+        monkeypatch.setattr(
+            homework_module,
+            'send_error',
+            lambda bot, error, sent_errors: errors.append(error)
+        )
+        homeworks = self.make_homeworks(2) + [
+            {'homework_name': 'broken', 'status': 'unknown'}
+        ]
+        homework_module.send_report(
+            utils.MockTelegramBot(), homeworks, '', {}
+        )
+        assert sent_messages == [
+            homework_module.build_report(homeworks[:2])[0]
+        ]
+        assert len(errors) == 1
+        assert isinstance(errors[0], homework_module.StatusNotFoundError)
+
+    def test_unchanged_report_is_not_resent(self, homework_module,
+                                            sent_messages):
+        homeworks = self.make_homeworks(2)
+        last_message = homework_module.send_report(
+            utils.MockTelegramBot(), homeworks, '', {}
+        )
+        homework_module.send_report(
+            utils.MockTelegramBot(), homeworks, last_message, {}
+        )
+        assert len(sent_messages) == 1, (
+            'Неизменившийся отчет не должен отправляться повторно.'
+        )
@@ -0,0 +1,101 @@
+import random
+import time
+from http import HTTPStatus
+
+import pytest
+import requests
+import telegram
+
+import utils
+
+
+class MockResponse429(utils.MockResponseGET):
+    def __init__(self, *args, retry_after='', **kwargs):
+        super().__init__(
+            *args, http_status=HTTPStatus.TOO_MANY_REQUESTS, **kwargs
+        )
+        self.headers = {'Retry-After': retry_after}
+
+
+class TestRetry:
+
+    @pytest.fixture
+    def upper_bound_uniform(self, monkeypatch):
+        monkeypatch.setattr(random, 'uniform', lambda low, high: high)
+
+    def test_retry_delay_is_capped(self, homework_module,
+                                   upper_bound_uniform):
+        delay = homework_module.get_retry_delay(20)
+        assert delay == homework_module.BACKOFF_CAP, (
+            'Пауза после сбоя не должна превышать `BACKOFF_CAP`.'
+        )
+
+    def test_retry_delay_grows_with_attempt(self, homework_module,
+                                            upper_bound_uniform):
+        assert homework_module.get_retry_delay(1) == 4
+        assert homework_module.get_retry_delay(2) == 8
+
+    def test_retry_after_is_lower_bound(self, homework_module,
+                                        upper_bound_uniform):
+        assert homework_module.get_retry_delay(1, retry_after=120) == 120, (
+            'Пауза не должна быть меньше значения `Retry-After`.'
+        )
+        assert homework_module.get_retry_delay(2, retry_after=3) == 8, (
+            '`Retry-After` не должен сокращать рассчитанную паузу.'
+        )
+
+    @pytest.mark.parametrize('header, expected', [
+        ('120', 120),
+        ('Wed, 21 Oct 2015 07:28:00 GMT', None),
+        ('', None),
+    ])
+    def test_get_api_answer_parses_retry_after(self, monkeypatch,
+                                               current_timestamp,
+                                               homework_module,
+                                               header, expected):
+        monkeypatch.setattr(
+            requests,
+            'get',
+            lambda *args, **kwargs: MockResponse429(retry_after=header)
+        )
+        with pytest.raises(homework_module.APINotFoundError) as error:
+            homework_module.get_api_answer(current_timestamp)
+        assert error.value.retry_after == expected, (
+            'Проверьте разбор заголовка `Retry-After` при ответе 429.'
+        )
+
+    def test_attempt_is_reset_after_success(self, monkeypatch,
+                                            random_timestamp,
+                                            homework_module,
+                                            upper_bound_uniform):
+        responses = [
+            utils.MockResponseGET(
+                http_status=HTTPStatus.INTERNAL_SERVER_ERROR, data={}
+            ),
+            utils.MockResponseGET(
+                http_status=HTTPStatus.INTERNAL_SERVER_ERROR, data={}
+            ),
+            utils.MockResponseGET(random_timestamp=random_timestamp),
+            utils.MockResponseGET(
+                http_status=HTTPStatus.INTERNAL_SERVER_ERROR, data={}
+            ),
+        ]
+        cycles = len(responses)
+        sleeps = []
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == cycles:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            requests, 'get', lambda *args, **kwargs: responses.pop(0)
+        )
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert sleeps == [4, 8, homework_module.RETRY_PERIOD, 4], (
+            'После успешного запроса счетчик попыток должен сбрасываться.'
+        )
@@ -0,0 +1,82 @@
+import time
+
+import pytest
+import telegram
+
+import utils
+
+
+class CountingTelegramBot(utils.MockTelegramBot):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sent = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        self.sent.append(text)
+
+
+class FailingTelegramBot(CountingTelegramBot):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = True
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        if self.fail:
+            raise telegram.error.TelegramError('Something wrong')
+        super().send_message(chat_id, text, **kwargs)
+
+
+class TestSendError:
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+        return now
+
+    def test_repeated_error_is_suppressed(self, homework_module, clock):
+        bot = CountingTelegramBot()
+        sent_errors = {}
+        for _ in range(3):
+            homework_module.send_error(bot, ValueError('a'), sent_errors)
+            clock[0] += 600
+        assert len(bot.sent) == 1, (
+            'Одинаковая ошибка должна отправляться не чаще раза в '
+            '`ERROR_REPEAT_PERIOD`.'
+        )
+
+    def test_alternating_errors_are_suppressed(self, homework_module, clock):
+        bot = CountingTelegramBot()
+        sent_errors = {}
+        for text in ('a', 'b', 'a', 'b'):
+            homework_module.send_error(bot, ValueError(text), sent_errors)
+            clock[0] += 600
+        assert len(bot.sent) == 2
+
+    def test_error_is_resent_after_period(self, homework_module, clock):
+        bot = CountingTelegramBot()
+        sent_errors = {}
+        homework_module.send_error(bot, ValueError('a'), sent_errors)
+        clock[0] += homework_module.ERROR_REPEAT_PERIOD
+        homework_module.send_error(bot, ValueError('b'), sent_errors)
+        assert len(sent_errors) == 1, (
+            'Устаревшие записи должны удаляться из `sent_errors`.'
+        )
+        homework_module.send_error(bot, ValueError('a'), sent_errors)
+        assert len(bot.sent) == 3, (
+            'По истечении `ERROR_REPEAT_PERIOD` ошибка должна '
+            'отправляться повторно.'
+        )
+
+    def test_failed_send_is_not_recorded(self, homework_module, clock):
+        bot = FailingTelegramBot()
+        sent_errors = {}
+        homework_module.send_error(bot, ValueError('a'), sent_errors)
+        assert sent_errors == {}, (
+            'Неотправленная ошибка не должна запоминаться.'
+        )
+        bot.fail = False
+        homework_module.send_error(bot, ValueError('a'), sent_errors)
+        assert len(bot.sent) == 1, (
+            'Ошибка должна быть отправлена повторно после сбоя Telegram.'
+        )
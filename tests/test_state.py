@@ -0,0 +1,78 @@
+import logging
+import os
+import time
+
+import pytest
+
+import utils
+
+
+class TestState:
+
+    @pytest.fixture
+    def state_file(self, monkeypatch, tmp_path, homework_module):
+        state_file = tmp_path / 'last_timestamp'
+        monkeypatch.setattr(homework_module, 'STATE_FILE', str(state_file))
+        return state_file
+
+    def test_load_existing_timestamp(self, homework_module, state_file):
+        state_file.write_text('123')
+        assert homework_module.load_timestamp() == 123
+
+    @pytest.mark.parametrize('content', [None, '', 'None'])
+    def test_load_falls_back_to_current_time(self, monkeypatch,
+                                             homework_module, state_file,
+                                             content):
+        if content is not None:
+            state_file.write_text(content)
+        monkeypatch.setattr(time, 'time', lambda: 500.5)
+        assert homework_module.load_timestamp() == 500
+        assert state_file.read_text() == '500', (
+            'Стартовая метка времени должна сохраняться, если файл '
+            'отсутствует или поврежден.'
+        )
+
+    def test_save_is_atomic(self, monkeypatch, homework_module, state_file):
+        replaced = []
+        original_replace = os.replace
+
+        def mock_replace(src, dst):
+            replaced.append((src, dst))
+            assert open(src, encoding='utf-8').read() == '42'
+            original_replace(src, dst)
+
+        monkeypatch.setattr(os, 'replace', mock_replace)
+        homework_module.save_timestamp(42)
+        assert replaced == [(f'{state_file}.tmp', str(state_file))], (
+            'Метка времени должна записываться во временный файл и '
+            'переименовываться через `os.replace`.'
+        )
+        assert state_file.read_text() == '42'
+        assert not os.path.exists(f'{state_file}.tmp')
+
+    def test_save_error_is_logged(self, monkeypatch, tmp_path, caplog,
+                                  homework_module):
+        monkeypatch.setattr(
+            homework_module,
+            'STATE_FILE',
+            str(tmp_path / 'missing' / 'last_timestamp')
+        )
+        with caplog.at_level(logging.ERROR):
+            homework_module.save_timestamp(42)
+        assert any(
+            homework_module.STATE_SAVE_FAILURE in record.getMessage()
+            for record in caplog.records
+        ), 'Ошибка сохранения метки времени должна логироваться.'
+
+    def test_main_saves_current_date_on_empty_response(self, monkeypatch,
+                                                       homework_module,
+                                                       state_file):
+        utils.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [utils.MockResponseGET(random_timestamp=777)]
+        )
+        assert state_file.read_text() == '777', (
+            'Метка `current_date` должна сохраняться и при пустом '
+            'списке домашних работ.'
+        )
@@ -1,6 +1,7 @@
 import logging
 import signal
 import re
+import time
 from collections import namedtuple
 from contextlib import contextmanager
 from functools import wraps
@@ -8,6 +9,9 @@ from http import HTTPStatus
 from inspect import signature
 from types import ModuleType
 
+import requests
+import telegram
+
 
 def get_clean_source_code(raw_src: str) -> str:
     comment_pattern = re.compile(r'\s*#[^\n]*')
@@ -113,6 +117,9 @@ class MockTelegramBot:
         self.chat_id = chat_id
         self.text = text
 
+    def get_me(self, **kwargs):
+        return None
+
 
 class BreakInfiniteLoop(Exception):
     pass
@@ -138,6 +145,30 @@ class Timeout:
         signal.alarm(0)
 
 
+def run_main_cycles(monkeypatch, scope: ModuleType, responses,
+                    bot_class=MockTelegramBot):
+    """Run `main()` once per API response and return the sleep periods."""
+    responses = list(responses)
+    cycles = len(responses)
+    sleeps = []
+
+    def mock_sleep(secs):
+        sleeps.append(secs)
+        if len(sleeps) == cycles:
+            raise BreakInfiniteLoop('break')
+
+    monkeypatch.setattr(
+        requests, 'get', lambda *args, **kwargs: responses.pop(0)
+    )
+    monkeypatch.setattr(time, 'sleep', mock_sleep)
+    monkeypatch.setattr(telegram, 'Bot', bot_class)
+    try:
+        scope.main()
+    except BreakInfiniteLoop:
+        pass
+    return sleeps
+
+
 def with_timeout(f):
     """Make function raise TimeoutError after `timeout` seconds.
     This is a decorator.